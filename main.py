@@ -49,8 +49,10 @@ def process_directory(directory: str, ai_model: str, client: OpenAI) -> None:
     for root, _, files in os.walk(directory):
         for file in files:
             file_path: str = os.path.join(root, file)
+            # os.walk only lists non-directories here, and the MIME check
+            # below is the same one process_file would repeat.
             if is_supported_filetype(file_path):
-                process_file(file_path, ai_model, client)
+                process_file(file_path, ai_model, client, validate=False)
 
 
 def handle_suggested_changes() -> None:
@@ -60,9 +62,12 @@ def handle_suggested_changes() -> None:
         print("No changes were suggested.")
         return
 
-    for change in suggested_changes:
-        print(f"Current Name: {change['file_path']}")
-        print(f"Suggested Name: {change['suggested_name']}\n")
+    # Emit the whole listing in one write rather than two prints per change
+    sys.stdout.write("".join(
+        f"Current Name: {change['file_path']}\n"
+        f"Suggested Name: {change['suggested_name']}\n\n"
+        for change in suggested_changes
+    ))
 
     user_confirmation = input("Approve rename? (yes/no): ").strip().lower()
     if user_confirmation == 'yes':
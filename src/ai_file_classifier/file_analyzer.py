@@ -2,7 +2,7 @@
 
 import logging
 import os
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from openai import OpenAI
 from pydantic import BaseModel
@@ -22,6 +22,11 @@ class Analysis(BaseModel):
     date: Optional[str]
 
 
+def _standardize_field(value: str) -> str:
+    """Lowercase a metadata field and replace spaces with hyphens."""
+    return value.lower().replace(' ', '-')
+
+
 def standardize_analysis(analysis: Analysis) -> Analysis:
     """
     Standardize the analysis data by converting fields to lowercase and
@@ -33,12 +38,14 @@ def standardize_analysis(analysis: Analysis) -> Analysis:
     Returns:
         Analysis: A new Analysis object with standardized fields.
     """
-    return Analysis(
-        category=analysis.category.lower().replace(' ', '-'),
-        vendor=analysis.vendor.lower().replace(' ', '-'),
-        description=analysis.description.lower().replace(' ', '-'),
-        date=analysis.date if analysis.date else ''
-    )
+    # The source model is already validated, so copy it with updated
+    # fields instead of running validation again on construction.
+    return analysis.model_copy(update={
+        'category': _standardize_field(analysis.category),
+        'vendor': _standardize_field(analysis.vendor),
+        'description': _standardize_field(analysis.description),
+        'date': analysis.date if analysis.date else ''
+    })
 
 
 def analyze_file_content(file_path: str, model: str, client: OpenAI) -> \
@@ -98,7 +105,7 @@ def analyze_file_content(file_path: str, model: str, client: OpenAI) -> \
         vendor: str = analyzed_data.vendor
         description: str = analyzed_data.description
         date: str = analyzed_data.date
-        suggested_name: str = generate_filename(analyzed_data)
+        suggested_name: str = _join_filename(analyzed_data)
 
         # Add debug output for the standardized metadata
         logger.debug("Standardized metadata: %s", analyzed_data)
@@ -110,14 +117,14 @@ def analyze_file_content(file_path: str, model: str, client: OpenAI) -> \
 
 def generate_filename(analysis: Analysis) -> str:
     """Generate a standardized filename based on the analysis data."""
-    category: str = analysis.category.lower().replace(' ', '-')
-    vendor: str = analysis.vendor.lower().replace(' ', '-')
-    description: str = analysis.description.lower().replace(' ', '-')
-    date: str = analysis.date if analysis.date else ''
+    return _join_filename(standardize_analysis(analysis))
+
 
-    filename: str = (
-        f"{vendor}-{category}-{description}"
-        f"{'-' + date if date else ''}"
-    )
+def _join_filename(analysis: Analysis) -> str:
+    """Join the fields of an already standardized analysis into a filename."""
+    parts: List[str] = [analysis.vendor, analysis.category,
+                        analysis.description]
+    if analysis.date:
+        parts.append(analysis.date)
 
-    return filename
+    return '-'.join(parts)
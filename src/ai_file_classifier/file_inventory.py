@@ -3,19 +3,27 @@
 import logging
 import sqlite3
 
-from src.config.cache_config import DB_FILE
+from src.config.cache_config import get_connection
 
 logger = logging.getLogger(__name__)
 
+# Bump when the cache schema changes; initialize_cache only runs its DDL
+# when the database's user_version is older than this.
+CACHE_SCHEMA_VERSION: int = 1
+
 
 def initialize_cache() -> None:
     """
     Initializes the SQLite cache database, creating the necessary
-    table if it does not exist.
+    table unless the schema is already at CACHE_SCHEMA_VERSION.
     """
     try:
-        conn: sqlite3.Connection = sqlite3.connect(DB_FILE)
+        conn: sqlite3.Connection = get_connection()
         cursor: sqlite3.Cursor = conn.cursor()
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] >= CACHE_SCHEMA_VERSION:
+            logger.debug("Cache database schema is up to date.")
+            return
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS files (
                 id INTEGER PRIMARY KEY,
@@ -27,10 +35,8 @@ def initialize_cache() -> None:
                 suggested_name TEXT
             )
         ''')
+        cursor.execute(f"PRAGMA user_version = {CACHE_SCHEMA_VERSION}")
         conn.commit()
         logger.debug("Cache database initialized successfully.")
     except sqlite3.Error as e:
         logger.error("Error initializing cache database: %s", e, exc_info=True)
-    finally:
-        if 'conn' in locals():
-            conn.close()
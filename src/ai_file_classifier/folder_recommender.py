@@ -1,23 +1,33 @@
 """Module for recommending folder structures based on file categories."""
 
 import logging
-import sqlite3
+from typing import List
+
+from src.config.cache_config import get_connection
 
 logger = logging.getLogger(__name__)
 
+# One row per distinct category, in sorted order.
+SELECT_CATEGORIES_SQL: str = (
+    "SELECT category FROM files WHERE category IS NOT NULL "
+    "GROUP BY category ORDER BY category"
+)
+
 
-def recommend_folder_structure():
+def recommend_folder_structure() -> List[str]:
     """
     Recommend a folder structure based on the file categories.
+
+    Returns:
+        List[str]: The distinct cached categories in sorted order.
     """
-    conn = sqlite3.connect('file_cache.db')
-    cursor = conn.cursor()
-    cursor.execute(
-        "SELECT DISTINCT category FROM files WHERE category IS NOT NULL")
-    categories = [row[0] for row in cursor.fetchall()]
-    conn.close()
-
-    # Display recommended structure
-    logger.info("Recommended Folder Structure:")
-    for category in categories:
-        logger.info("- %s", category)
+    cursor = get_connection().cursor()
+    cursor.execute(SELECT_CATEGORIES_SQL)
+    categories: List[str] = [category for (category,) in cursor]
+
+    # Display recommended structure as a single log record
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Recommended Folder Structure:\n%s",
+                    "\n".join(f"- {category}" for category in categories))
+
+    return categories
@@ -4,10 +4,41 @@ This module provides functionality for loading and formatting AI prompts.
 """
 
 import logging
-from typing import Any
+import os
+from typing import Any, Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Raw prompt text keyed by path, stored with the file's mtime so an edited
+# prompt is re-read while unchanged prompts skip the disk entirely.
+_PROMPT_CACHE: Dict[str, Tuple[int, str]] = {}
+
+
+def _read_prompt(file_path: str) -> str:
+    """
+    Read a prompt file, reusing the cached text while it is unmodified.
+
+    Args:
+        file_path (str): The path to the prompt file.
+
+    Returns:
+        str: The raw, unformatted prompt text.
+    """
+    mtime_ns: int = os.stat(file_path).st_mtime_ns
+    cached = _PROMPT_CACHE.get(file_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    with open(file_path, 'r', encoding='utf-8') as file:
+        prompt: str = file.read()
+    _PROMPT_CACHE[file_path] = (mtime_ns, prompt)
+    return prompt
+
+
+def clear_prompt_cache() -> None:
+    """Discard all cached prompt text."""
+    _PROMPT_CACHE.clear()
+
 
 def load_and_format_prompt(file_path: str, **kwargs: Any) -> str:
     """
@@ -21,9 +52,7 @@ def load_and_format_prompt(file_path: str, **kwargs: Any) -> str:
         str: The formatted prompt or an empty string if an error occurs.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            prompt: str = file.read()
-        return prompt.format(**kwargs)
+        return _read_prompt(file_path).format(**kwargs)
     except FileNotFoundError:
         logger.error("Prompt file not found: %s", file_path)
     except PermissionError:
@@ -17,9 +17,10 @@ def extract_text_from_pdf(file_path: str) -> Optional[str]:
     try:
         with open(file_path, 'rb') as file:
             reader = pypdf.PdfReader(file)
-            content: str = ""
-            for page in reader.pages:
-                content += page.extract_text() + "\n"
+            # Join once instead of growing a string page by page
+            content: str = "".join(
+                page.extract_text() + "\n" for page in reader.pages
+            )
         logger.debug("Extracted text from PDF '%s'", file_path)
         return content
     except IOError as e:
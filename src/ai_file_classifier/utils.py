@@ -1,19 +1,37 @@
 """Utility functions for the AI File Classifier application."""
 
 import argparse
+import functools
 import hashlib
 import logging
 import os
 import sqlite3
-from typing import Any, Dict, List, Optional
+from typing import (Any, Dict, FrozenSet, Iterable, Iterator, List, Optional,
+                    Tuple)
 
 import magic
 
 from src.ai_file_classifier.file_analyzer import analyze_file_content
-from src.config.cache_config import DB_FILE
+from src.config.cache_config import get_connection
 
 logger = logging.getLogger(__name__)
 
+SUPPORTED_MIMETYPES: FrozenSet[str] = frozenset({"text/plain",
+                                                 "application/pdf"})
+
+INSERT_FILE_SQL: str = '''
+    INSERT OR REPLACE INTO files (
+        file_path, suggested_name, category, description, vendor, date
+    )
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+SELECT_SUGGESTED_CHANGES_SQL: str = '''
+    SELECT file_path, suggested_name
+    FROM files
+    WHERE suggested_name IS NOT NULL
+'''
+
 
 def get_user_arguments() -> argparse.Namespace:
     """
@@ -29,6 +47,17 @@ def get_user_arguments() -> argparse.Namespace:
     return parser.parse_args()
 
 
+@functools.cache
+def _get_mime_detector() -> magic.Magic:
+    """
+    Returns a shared libmagic MIME detector, created on first use.
+
+    Loading the magic database is far more expensive than a lookup, so the
+    detector is built once per process rather than once per file.
+    """
+    return magic.Magic(mime=True)
+
+
 def is_supported_filetype(file_path: str) -> bool:
     """
     Validate if the specified file is a supported type.
@@ -39,13 +68,11 @@ def is_supported_filetype(file_path: str) -> bool:
     Returns:
         bool: True if the file type is supported, False otherwise.
     """
-    supported_mimetypes: List[str] = ["text/plain", "application/pdf"]
     try:
-        mime = magic.Magic(mime=True)
-        mimetype: str = mime.from_file(file_path)
+        mimetype: str = _get_mime_detector().from_file(file_path)
         logger.debug("Detected MIME type for file '%s': %s",
                      file_path, mimetype)
-        return mimetype in supported_mimetypes
+        return mimetype in SUPPORTED_MIMETYPES
     except ImportError:
         logger.error("Failed to import 'magic' module", exc_info=True)
         return False
@@ -73,9 +100,12 @@ def calculate_md5(file_path: str) -> Optional[str]:
 
 def connect_to_db() -> sqlite3.Connection:
     """
-    Connects to the SQLite database and returns the connection object.
+    Returns the shared SQLite cache connection.
+
+    The connection is opened once per process and must not be closed by
+    callers; delete_cache() closes it on shutdown.
     """
-    return sqlite3.connect(DB_FILE)
+    return get_connection()
 
 
 def insert_or_update_file(
@@ -92,24 +122,8 @@ def insert_or_update_file(
         metadata (Dict[str, Optional[str]]): Dictionary containing additional
             metadata fields (category, description, vendor, date).
     """
-    conn: Optional[sqlite3.Connection] = None
     try:
-        conn = connect_to_db()
-        cursor: sqlite3.Cursor = conn.cursor()
-        cursor.execute('''
-            INSERT OR REPLACE INTO files (
-                file_path, suggested_name, category, description, vendor, date
-            )
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
-            file_path,
-            suggested_name,
-            metadata.get('category'),
-            metadata.get('description'),
-            metadata.get('vendor'),
-            metadata.get('date')
-        ))
-        conn.commit()
+        _write_file_records([(file_path, suggested_name, metadata)])
         logger.debug(
             "File '%s' cache updated with suggested name '%s'.",
             file_path,
@@ -122,27 +136,78 @@ def insert_or_update_file(
             str(e),
             exc_info=True
         )
-    finally:
-        if conn:
-            conn.close()
+
+
+def insert_or_update_files_bulk(
+    records: Iterable[Tuple[str, str, Dict[str, Optional[str]]]]
+) -> None:
+    """
+    Insert or update many file records in the cache in a single transaction.
+
+    Args:
+        records (Iterable[Tuple[str, str, Dict[str, Optional[str]]]]):
+            (file_path, suggested_name, metadata) tuples, where metadata has
+            the same keys as for insert_or_update_file.
+    """
+    try:
+        count: int = _write_file_records(records)
+        logger.debug("Cache updated with %d file record(s).", count)
+    except sqlite3.Error as e:
+        logger.error(
+            "SQLite error inserting or updating files: %s",
+            str(e),
+            exc_info=True
+        )
+
+
+def _write_file_records(
+    records: Iterable[Tuple[str, str, Dict[str, Optional[str]]]]
+) -> int:
+    """
+    Write file records to the cache in one transaction.
+
+    Returns:
+        int: The number of rows written.
+
+    Raises:
+        sqlite3.Error: If the write fails; the transaction is rolled back.
+    """
+    conn: sqlite3.Connection = connect_to_db()
+    with conn:
+        cursor: sqlite3.Cursor = conn.executemany(INSERT_FILE_SQL, (
+            (
+                file_path,
+                suggested_name,
+                metadata.get('category'),
+                metadata.get('description'),
+                metadata.get('vendor'),
+                metadata.get('date')
+            )
+            for file_path, suggested_name, metadata in records
+        ))
+    return cursor.rowcount
+
+
+def iter_suggested_changes() -> Iterator[Dict[str, str]]:
+    """
+    Yields files with suggested changes from the SQLite database one row at
+    a time, without materializing the whole result set.
+
+    Raises:
+        sqlite3.Error: If the cache cannot be queried.
+    """
+    cursor: sqlite3.Cursor = connect_to_db().cursor()
+    cursor.execute(SELECT_SUGGESTED_CHANGES_SQL)
+    for file_path, suggested_name in cursor:
+        yield {'file_path': file_path, 'suggested_name': suggested_name}
 
 
 def get_all_suggested_changes() -> List[Dict[str, str]]:
     """
     Retrieves all files with suggested changes from the SQLite database.
     """
-    conn: Optional[sqlite3.Connection] = None
     try:
-        conn = connect_to_db()
-        cursor: sqlite3.Cursor = conn.cursor()
-        cursor.execute('''
-            SELECT file_path, suggested_name
-            FROM files
-            WHERE suggested_name IS NOT NULL
-        ''')
-        changes: List[Dict[str, str]] = [{'file_path': row[0],
-                                          'suggested_name': row[1]}
-                                         for row in cursor.fetchall()]
+        changes: List[Dict[str, str]] = list(iter_suggested_changes())
         logger.debug("Retrieved %d suggested changes from cache.",
                      len(changes))
         return changes
@@ -150,9 +215,6 @@ def get_all_suggested_changes() -> List[Dict[str, str]]:
         logger.error("SQLite error retrieving suggested changes: %s", str(e),
                      exc_info=True)
         return []
-    finally:
-        if conn:
-            conn.close()
 
 
 def rename_files(suggested_changes: List[Dict[str, str]]) -> None:
@@ -173,21 +235,37 @@ def rename_files(suggested_changes: List[Dict[str, str]]) -> None:
                          file_path, suggested_name, str(e), exc_info=True)
 
 
-def process_file(file_path: str, model: str, client: Any) -> None:
+def process_file(
+    file_path: str,
+    model: str,
+    client: Any,
+    validate: bool = True
+) -> None:
     """
     Processes a single file by analyzing its content and caching metadata.
+
+    Args:
+        file_path (str): Path to the file.
+        model (str): Name of the AI model used for analysis.
+        client (Any): Client used to call the AI model.
+        validate (bool): Check that the path exists, is a file and is a
+            supported type. Callers that have already filtered the path
+            (e.g. a directory walk) can pass False to skip the repeated
+            stat calls and MIME detection.
     """
-    if not os.path.exists(file_path):
-        logger.error("The file '%s' does not exist.", file_path)
-        return
+    if validate:
+        if not os.path.exists(file_path):
+            logger.error("The file '%s' does not exist.", file_path)
+            return
 
-    if not os.path.isfile(file_path):
-        logger.error("The path '%s' is not a file.", file_path)
-        return
+        if not os.path.isfile(file_path):
+            logger.error("The path '%s' is not a file.", file_path)
+            return
 
-    if not is_supported_filetype(file_path):
-        logger.error("The file '%s' is not a supported file type.", file_path)
-        return
+        if not is_supported_filetype(file_path):
+            logger.error("The file '%s' is not a supported file type.",
+                         file_path)
+            return
 
     try:
         suggested_name, category, vendor, description, \
@@ -2,17 +2,50 @@
 
 import logging
 import os
+import sqlite3
 import sys
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 DB_FILE: str = "file_cache.db"
 
+_CONNECTION: Optional[sqlite3.Connection] = None
+
+
+def get_connection() -> sqlite3.Connection:
+    """
+    Return the shared cache database connection, opening it on first use.
+
+    The connection is reused by every cache operation in the process until
+    close_connection() or delete_cache() is called.
+    """
+    global _CONNECTION  # pylint: disable=global-statement
+    if _CONNECTION is None:
+        _CONNECTION = sqlite3.connect(DB_FILE)
+        # The cache is disposable (deleted on exit), so skip fsyncs; SQLite
+        # stays consistent across application crashes with this setting.
+        _CONNECTION.execute("PRAGMA synchronous=OFF")
+        _CONNECTION.execute("PRAGMA temp_store=MEMORY")
+        logger.debug("Opened cache database connection to '%s'.", DB_FILE)
+    return _CONNECTION
+
+
+def close_connection() -> None:
+    """Close the shared cache database connection if it is open."""
+    global _CONNECTION  # pylint: disable=global-statement
+    if _CONNECTION is not None:
+        _CONNECTION.close()
+        _CONNECTION = None
+
 
 def delete_cache() -> None:
-    """Delete the cache file if it exists."""
-    if os.path.exists(DB_FILE):
-        os.remove(DB_FILE)
+    """Close the cache connection and delete the cache file if it exists."""
+    close_connection()
+    try:
+        os.unlink(DB_FILE)
+    except FileNotFoundError:
+        pass
 
 
 def handle_signal() -> None:
@@ -9,7 +9,8 @@ import sqlite3
 import pytest
 
 from src.config.cache_config import DB_FILE, delete_cache
-from src.ai_file_classifier.file_inventory import initialize_cache
+from src.ai_file_classifier.file_inventory import (CACHE_SCHEMA_VERSION,
+                                                   initialize_cache)
 
 logger = logging.getLogger(__name__)
 
@@ -40,5 +41,26 @@ def test_initialize_cache():
     conn.close()
 
 
+def test_initialize_cache_sets_schema_version():
+    """
+    Test that the cache records its schema version after initialization.
+    """
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA user_version")
+    assert cursor.fetchone()[0] == CACHE_SCHEMA_VERSION
+    conn.close()
+
+
+def test_delete_cache_when_missing():
+    """
+    Test that deleting an already-removed cache is a no-op.
+    """
+    delete_cache()
+    assert not os.path.exists(DB_FILE)
+    delete_cache()
+    assert not os.path.exists(DB_FILE)
+
+
 if __name__ == "__main__":
     pytest.main()
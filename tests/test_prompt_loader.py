@@ -8,12 +8,27 @@ import tempfile
 
 import pytest
 
-from src.ai_file_classifier.prompt_loader import load_and_format_prompt
+from src.ai_file_classifier.prompt_loader import (clear_prompt_cache,
+                                                  load_and_format_prompt)
 
 logger = logging.getLogger(__name__)
 
 
-def test_load_and_format_prompt():
+@pytest.fixture(autouse=True)
+def reset_prompt_cache():
+    """Isolate each test from prompt text cached by earlier tests."""
+    clear_prompt_cache()
+    yield
+    clear_prompt_cache()
+
+
+@pytest.mark.parametrize("kwargs, expected", [
+    # Valid keyword arguments
+    ({'name': "Alice"}, "Hello, Alice! This is a test prompt."),
+    # Missing keyword arguments
+    ({}, ""),
+])
+def test_load_and_format_prompt(kwargs, expected):
     """
     Test the loading and formatting of a prompt from a file.
     """
@@ -23,13 +38,8 @@ def test_load_and_format_prompt():
         temp_prompt_file_path = temp_prompt_file.name
 
     try:
-        # Test loading and formatting with valid keyword arguments
-        result = load_and_format_prompt(temp_prompt_file_path, name="Alice")
-        assert result == "Hello, Alice! This is a test prompt."
-
-        # Test loading and formatting with missing keyword arguments
-        result = load_and_format_prompt(temp_prompt_file_path)
-        assert result == ""
+        result = load_and_format_prompt(temp_prompt_file_path, **kwargs)
+        assert result == expected
     except FileNotFoundError:
         logger.error("Test failed: Prompt file not found.")
     except PermissionError:
@@ -44,5 +54,31 @@ def test_load_and_format_prompt():
             logger.warning("Failed to remove temporary file: %s", e)
 
 
+def test_load_and_format_prompt_rereads_modified_file():
+    """
+    Test that cached prompt text is refreshed when the file changes.
+    """
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".txt", mode='w',
+                                     encoding='utf-8') as temp_prompt_file:
+        temp_prompt_file.write("First {name}")
+        temp_prompt_file_path = temp_prompt_file.name
+
+    try:
+        assert load_and_format_prompt(temp_prompt_file_path,
+                                      name="one") == "First one"
+
+        with open(temp_prompt_file_path, 'w', encoding='utf-8') as file:
+            file.write("Second {name}")
+        # Force a distinct mtime regardless of filesystem resolution
+        stat = os.stat(temp_prompt_file_path)
+        os.utime(temp_prompt_file_path,
+                 ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_and_format_prompt(temp_prompt_file_path,
+                                      name="two") == "Second two"
+    finally:
+        os.remove(temp_prompt_file_path)
+
+
 if __name__ == "__main__":
     pytest.main()
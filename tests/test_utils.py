@@ -6,7 +6,13 @@ import tempfile
 
 import pytest
 
-from src.ai_file_classifier.utils import is_supported_filetype
+from src.ai_file_classifier.file_inventory import initialize_cache
+from src.ai_file_classifier.utils import (get_all_suggested_changes,
+                                          insert_or_update_file,
+                                          insert_or_update_files_bulk,
+                                          is_supported_filetype,
+                                          iter_suggested_changes)
+from src.config.cache_config import delete_cache
 
 logger = logging.getLogger(__name__)
 
@@ -50,5 +56,61 @@ def test_is_supported_filetype():
                     )
 
 
+def test_insert_or_update_files_bulk():
+    """
+    Test that bulk and single inserts are visible as suggested changes.
+    """
+    initialize_cache()
+    try:
+        insert_or_update_files_bulk([
+            ("docs/a.txt", "acme-invoice-widgets", {'category': 'invoice'}),
+            ("docs/b.pdf", "acme-receipt-groceries", {'category': 'receipt'}),
+        ])
+        # Re-inserting an existing path replaces its record
+        insert_or_update_file("docs/a.txt", "acme-invoice-gadgets",
+                              {'category': 'invoice'})
+
+        changes = sorted(get_all_suggested_changes(),
+                         key=lambda change: change['file_path'])
+        assert changes == [
+            {'file_path': "docs/a.txt",
+             'suggested_name': "acme-invoice-gadgets"},
+            {'file_path': "docs/b.pdf",
+             'suggested_name': "acme-receipt-groceries"},
+        ]
+    finally:
+        delete_cache()
+
+
+def test_insert_or_update_file_logs_path_on_error(caplog):
+    """
+    Test that a failed single-file insert reports which file failed.
+    """
+    # Without initialize_cache the files table does not exist
+    delete_cache()
+    try:
+        insert_or_update_file("docs/missing-table.txt", "acme-invoice",
+                              {'category': 'invoice'})
+        assert "docs/missing-table.txt" in caplog.text
+    finally:
+        delete_cache()
+
+
+def test_iter_suggested_changes():
+    """
+    Test that suggested changes can be streamed lazily from the cache.
+    """
+    initialize_cache()
+    try:
+        insert_or_update_file("docs/a.txt", "acme-invoice-widgets",
+                              {'category': 'invoice'})
+        changes = iter_suggested_changes()
+        assert next(changes) == {'file_path': "docs/a.txt",
+                                 'suggested_name': "acme-invoice-widgets"}
+        assert next(changes, None) is None
+    finally:
+        delete_cache()
+
+
 if __name__ == "__main__":
     pytest.main()